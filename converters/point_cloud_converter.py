@@ -1,13 +1,42 @@
 """Converter from CampaignGranule to PointCloud."""
+import math
 import numpy as np
 import xarray as xr
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, Optional
 from converters.base_converter import Converter
 
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+    prange = range
+
 if TYPE_CHECKING:
     from campaign_granule import CampaignGranule
 
+# Geodetic constants, hoisted so the hot loops neither rebuild them nor
+# divide: one degree of latitude is ~111 km, kept as a reciprocal.
+_DEG2RAD = math.pi / 180.0
+_INV_METERS_PER_DEG = 1.0 / 111000.0
+
+# Per-schema variable aliases: campaigns disagree on some variable names
+# (e.g. altitude ships as "height" or "alt"). Candidates are tried in order,
+# so each granule resolves its schema with dictionary lookups instead of
+# chained ds.get() probes, and new schemas extend the table rather than the
+# converter body.
+_VAR_ALIASES: dict[str, tuple[str, ...]] = {
+    "alt": ("height", "alt"),
+}
+
+def _resolve_var(ds: xr.Dataset, name: str) -> xr.DataArray:
+    """Return the dataset variable for `name`, trying schema aliases in order."""
+    candidates = _VAR_ALIASES.get(name, (name,))
+    for candidate in candidates:
+        if candidate in ds:
+            return ds[candidate]
+    raise KeyError(f"Granule has no variable for {name!r} (tried {candidates})")
+
 def down_vector(roll: np.ndarray, pitch: np.ndarray, head: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
     """Get down-vector coordinates from roll, pitch and head."""
     x = np.sin(roll) * np.cos(head) + np.cos(roll) * np.sin(pitch) * np.sin(head)
@@ -15,6 +44,88 @@ def down_vector(roll: np.ndarray, pitch: np.ndarray, head: np.ndarray) -> tuple[
     z = -np.cos(roll) * np.cos(pitch)
     return x, y, z
 
+def _compute_points(ref, lat, lon, alt, roll, pitch, head, rad_range, time_unix):
+    """Fused geodetic offset kernel: computes the per-point lon/lat/alt offsets
+    without materializing the repeated per-column arrays or the intermediate
+    down-vector temporaries. Points with non-finite reflectivity or
+    non-positive altitude are dropped. Columns are independent, so both passes
+    parallelize over `prange`: a counting pass sizes each column's slice of
+    the output, then a fill pass writes survivors at the column's offset,
+    preserving col-major (time) order. Angles are expected in radians;
+    `lat`, `lon`, `alt` in degrees/meters."""
+    num_col, num_row = ref.shape
+
+    # Pass 1: survivors per column. Both passes must apply this exact validity
+    # predicate, and the isfinite checks only work if the jit flags preserve
+    # NaN/Inf semantics (see the restricted fastmath set on the decorator).
+    counts = np.empty(num_col, dtype=np.int64)
+    for col in prange(num_col):
+        z = -math.cos(roll[col]) * math.cos(pitch[col])
+        c = 0
+        for row in range(num_row):
+            if math.isfinite(ref[col, row]) and alt[col] + z * rad_range[row] > 0.0:
+                c += 1
+        counts[col] = c
+
+    offsets = np.empty(num_col + 1, dtype=np.int64)
+    offsets[0] = 0
+    offsets[1:] = np.cumsum(counts)
+    n = offsets[num_col]
+
+    lon_out = np.empty(n, dtype=np.float32)
+    lat_out = np.empty(n, dtype=np.float32)
+    alt_out = np.empty(n, dtype=np.float32)
+    ref_out = np.empty(n, dtype=np.float32)
+    time_out = np.empty(n, dtype=np.int64)
+
+    # Pass 2: compute offsets and write each column's survivors
+    for col in prange(num_col):
+        sr = math.sin(roll[col])
+        cr = math.cos(roll[col])
+        sp = math.sin(pitch[col])
+        cp = math.cos(pitch[col])
+        sh = math.sin(head[col])
+        ch = math.cos(head[col])
+        x = sr * ch + cr * sp * sh
+        y = -sr * sh + cr * sp * ch
+        z = -cr * cp
+        x_scale = x * _INV_METERS_PER_DEG / math.cos(lat[col] * _DEG2RAD)
+        y_scale = y * _INV_METERS_PER_DEG
+        i = offsets[col]
+        for row in range(num_row):
+            r = ref[col, row]
+            if not math.isfinite(r):
+                continue
+            rng = rad_range[row]
+            a = alt[col] + z * rng
+            # Written as the exact negation of pass 1's `a > 0.0` so NaN
+            # altitude is skipped here too, not just left uncounted.
+            if not (a > 0.0):
+                continue
+            # Even with matching predicate text the two loops may compile
+            # differently (e.g. fastmath 'contract' fusing alt + z*rng as an
+            # FMA in one pass only), flipping boundary points between passes.
+            # Bound the cursor so any residual disagreement degrades to a
+            # short column instead of writing past its slice.
+            if i >= offsets[col + 1]:
+                break
+            lon_out[i] = lon[col] - x_scale * rng
+            lat_out[i] = lat[col] - y_scale * rng
+            alt_out[i] = a
+            ref_out[i] = r
+            time_out[i] = time_unix[col]
+            i += 1
+    return lon_out, lat_out, alt_out, ref_out, time_out
+
+if njit is not None:
+    # fastmath is restricted to flags that keep NaN/Inf semantics: nnan/ninf
+    # would let LLVM fold the kernel's isfinite filter to true and could make
+    # the counting and fill passes disagree on the validity predicate,
+    # overrunning the per-column output slices.
+    _compute_points = njit(
+        parallel=True, fastmath={'contract', 'arcp', 'reassoc'}, cache=True
+    )(_compute_points)
+
 @dataclass
 class PointCloud:
     """Data class for point cloud data."""
@@ -35,49 +146,53 @@ class PointCloudConverter(Converter):
         time = granule.normal_time.astype("datetime64[s]").values
         time_unix = (time - np.datetime64("1970-01-01")).astype("int64")
 
-        ref = ds["ref"].values
-        lat = ds["lat"].values
-        lon = ds["lon"].values
-        alt = ds.get("height", ds.get("alt")).values
-        roll = ds["roll"].values * np.pi / 180
-        pitch = ds["pitch"].values * np.pi / 180
-        head = ds["head"].values * np.pi / 180
-        rad_range = ds["range"].values
+        # Work in float32 throughout the transform: halves memory bandwidth on
+        # this memory-bound path and matches the float32 precision the Zarr
+        # and CZML outputs are stored at anyway (~1 m for degree coordinates).
+        ref = ds["ref"].values.astype(np.float32, copy=False)
+        lat = ds["lat"].values.astype(np.float32, copy=False)
+        lon = ds["lon"].values.astype(np.float32, copy=False)
+        alt = _resolve_var(ds, "alt").values.astype(np.float32, copy=False)
+        roll = np.radians(ds["roll"].values.astype(np.float32, copy=False))
+        pitch = np.radians(ds["pitch"].values.astype(np.float32, copy=False))
+        head = np.radians(ds["head"].values.astype(np.float32, copy=False))
+        rad_range = ds["range"].values.astype(np.float32, copy=False)
 
         num_col, num_row = ref.shape
 
-        time = np.repeat(time_unix, num_row)
-        lon = np.repeat(lon, num_row)
-        lat = np.repeat(lat, num_row)
-        alt = np.repeat(alt, num_row)
-        roll = np.repeat(roll, num_row)
-        pitch = np.repeat(pitch, num_row)
-        head = np.repeat(head, num_row)
-        rad_range = np.tile(rad_range, num_col)
-        ref = ref.flatten()
-
-        x, y, z = down_vector(roll, pitch, head)
-        x = np.multiply(x, np.divide(rad_range, 111000 * np.cos(lat * np.pi / 180)))
-        y = np.multiply(y, np.divide(rad_range, 111000))
-        z = np.multiply(z, rad_range)
-
-        lon = np.add(-x, lon)
-        lat = np.add(-y, lat)
-        alt = np.add(z, alt)
-
-        sort_idx = np.argsort(time)
-        lon = lon[sort_idx]
-        lat = lat[sort_idx]
-        alt = alt[sort_idx]
-        ref = ref[sort_idx]
-        time = time[sort_idx]
-
-        mask = np.logical_and(np.isfinite(ref), alt > 0)
-        lon = lon[mask]
-        lat = lat[mask]
-        alt = alt[mask]
-        ref = ref[mask]
-        time = time[mask]
+        if njit is not None:
+            lon, lat, alt, ref, time = _compute_points(
+                ref, lat, lon, alt, roll, pitch, head, rad_range, time_unix
+            )
+        else:
+            # Vectorized NumPy fallback when numba is unavailable. Broadcasting
+            # (num_col, 1) x (1, num_row) views replace the old np.repeat/np.tile
+            # copies, so no expanded inputs are ever materialized.
+            rad2d = rad_range[None, :]
+
+            x, y, z = down_vector(roll[:, None], pitch[:, None], head[:, None])
+            x = np.multiply(x, rad2d * _INV_METERS_PER_DEG / np.cos(np.radians(lat[:, None])))
+            y = np.multiply(y, rad2d * _INV_METERS_PER_DEG)
+            z = np.multiply(z, rad2d)
+
+            lon = np.add(-x, lon[:, None]).ravel()
+            lat = np.add(-y, lat[:, None]).ravel()
+            alt = np.add(z, alt[:, None]).ravel()
+            time = np.repeat(time_unix, num_row)
+            ref = ref.ravel()
+
+            # Single validity mask: finite reflectivity AND above-ground, with
+            # the isfinite result reused in place as the combined mask.
+            mask = np.isfinite(ref)
+            mask &= alt > 0
+            lon = lon[mask]
+            lat = lat[mask]
+            alt = alt[mask]
+            ref = ref[mask]
+            time = time[mask]
+
+        # No sort needed: points are emitted col-major and the per-column time
+        # is non-decreasing, so the flattened time is already monotonic.
 
         # Wrap in DataArrays
         coords = {"point": np.arange(time.shape[0])}
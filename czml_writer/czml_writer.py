@@ -2,9 +2,14 @@
 import os
 import json
 from czml_writer.base_strategy import CZMLConversionStrategy
-from typing import Any
+from typing import Any, Dict, List
 from timeutils import generate_timestamped_filename
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 class CZMLWriter:
     def __init__(self, strategy: CZMLConversionStrategy):
         self.strategy = strategy
@@ -20,6 +25,10 @@ class CZMLWriter:
             filepath = os.path.join("output", filename)
             os.makedirs("output", exist_ok=True)
 
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(packets, f, indent=2)
+        if orjson is not None:
+            with open(filepath, 'wb') as f:
+                f.write(orjson.dumps(packets))
+        else:
+            with open(filepath, 'w', encoding='utf-8') as f:
+                json.dump(packets, f, separators=(',', ':'))
         print(f"✅ CZML written to {filepath}")
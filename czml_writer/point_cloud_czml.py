@@ -1,6 +1,6 @@
 import numpy as np
 from typing import List, Dict
-from czml_writers.base_strategy import CZMLConversionStrategy
+from czml_writer.base_strategy import CZMLConversionStrategy
 from converters.point_cloud_converter import PointCloud
 import datetime
 
@@ -20,13 +20,20 @@ class PointCloudToCZMLConverter(CZMLConversionStrategy):
         lon = cloud.lon.values
         lat = cloud.lat.values
         alt = cloud.alt.values
-        epoch = np.min(times).astype('datetime64[s]').astype(str)
-        seconds = (times - np.min(times)).astype('timedelta64[s]').astype(int)
+        t0 = np.min(times)
+        epoch = t0.astype('datetime64[s]').astype(str)
+        seconds = (times - t0).astype('timedelta64[s]').astype(int)
 
         if mode == "path":
-            coords = []
-            for t, lo, la, al in zip(seconds, lon, lat, alt):
-                coords.extend([int(t), float(lo), float(la), float(al)])
+            # Interleave [t, lon, lat, alt] per point in one preallocated array
+            # rather than a per-point Python loop; the cast to a flat list then
+            # happens once at C level.
+            coords_arr = np.empty((len(seconds), 4), dtype=np.float64)
+            coords_arr[:, 0] = seconds
+            coords_arr[:, 1] = lon
+            coords_arr[:, 2] = lat
+            coords_arr[:, 3] = alt
+            coords = coords_arr.ravel(order='C').tolist()
 
             packets.append({
                 "id": "pointcloud-path",
@@ -45,18 +52,27 @@ class PointCloudToCZMLConverter(CZMLConversionStrategy):
             })
 
         elif mode == "points":
-            for i, (t, lo, la, al) in enumerate(zip(times, lon, lat, alt)):
-                time_str = np.datetime_as_string(t, unit='s')
-                packets.append({
+            # Format all timestamps in one vectorized call, then build packets
+            # in a comprehension rather than a per-point append loop.
+            time_strs = np.datetime_as_string(times, unit='s')
+            # tolist() converts to Python floats in one C-level pass, so the
+            # comprehension below does no per-point casting.
+            lon_list = lon.tolist()
+            lat_list = lat.tolist()
+            alt_list = alt.tolist()
+            packets.extend(
+                {
                     "id": f"point-{i:06d}",
                     "availability": f"{time_str}/{time_str}",
                     "position": {
-                        "cartographicDegrees": [float(lo), float(la), float(al)]
+                        "cartographicDegrees": [lo, la, al]
                     },
                     "point": {
                         "pixelSize": 4,
                         "color": {"rgba": [255, 0, 0, 255]}
                     }
-                })
+                }
+                for i, (time_str, lo, la, al) in enumerate(zip(time_strs, lon_list, lat_list, alt_list))
+            )
 
         return packets
@@ -8,6 +8,13 @@ import random
 import datetime
 from typing import Optional
 
+# Date-hint patterns, compiled once at import so get_date_hint does not pay
+# the re-cache lookup on every granule.
+_NON_DIGIT_RE = re.compile(r"[^0-9]")
+_ISO_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+_YYYYMMDD_FILENAME_RE = re.compile(r"((?:20|19)\d{6})")
+_ISO_FILENAME_RE = re.compile(r"^((?:20|19)\d{2}-\d{2}-\d{2})$")
+
 def has_wraparound(time_array: np.ndarray) -> bool:
     """Returns True if the array wraps around (i.e., drops backward).
     Some `time` arrays may be suspect, i.e. they wrap around to 0 at 24 hours."""
@@ -27,16 +34,29 @@ def resolve_time_hours(hr: np.ndarray, base_date: np.datetime64) -> np.ndarray:
     """
     hr = np.array(hr, dtype=np.float64)
 
-    # Detect wraparound
-    diff = np.diff(hr)
-    wrap_points = np.where(diff < 0)[0]
+    if hr.size < 32:
+        # Tiny arrays: a Python-level scan beats the dispatch overhead of the
+        # np.diff/np.where pipeline and allocates nothing.
+        vals = hr.tolist()
+        # Seed from the first element so it can never register as a wrap,
+        # matching the vector path (np.diff never compares element 0).
+        prev = vals[0] if vals else 0.0
+        shift = 0.0
+        for i, v in enumerate(vals):
+            if v < prev:
+                shift += 24.0
+            prev = v
+            vals[i] = v + shift
+        hr = np.array(vals, dtype=np.float64)
+    else:
+        # Detect wraparound
+        wraps = np.diff(hr) < 0
 
-    if wrap_points.size > 0:
-        # Each wrap indicates a new day, i.e. hour rollover
-        day_shifts = np.zeros_like(hr, dtype=int)
-        for i, wrap_index in enumerate(wrap_points, start=1):
-            day_shifts[wrap_index + 1:] += 1
-        hr += day_shifts * 24
+        if np.any(wraps):
+            # Each wrap indicates a new day, i.e. hour rollover; the running
+            # count of wraps seen so far gives the day shift at each index.
+            day_shifts = np.concatenate(([0], np.cumsum(wraps)))
+            hr += day_shifts * 24
 
     # Convert to datetime64
     delta = (hr * 3600).astype("timedelta64[s]")
@@ -53,13 +73,13 @@ def get_date_hint(attrs: dict, filename: str) -> Optional[np.datetime64]:
     """
     # Try 'date' in attributes (e.g., "20170517")
     if "date" in attrs:
-        date_str = re.sub(r"[^0-9]", "", str(attrs["date"]))
+        date_str = _NON_DIGIT_RE.sub("", str(attrs["date"]))
         if len(date_str) == 8:
             try:
                 return np.datetime64(f"{date_str[:4]}-{date_str[4:6]}-{date_str[6:]}")
             except ValueError:
                 pass
-        elif m := re.match(r"^\d{4}-\d{2}-\d{2}$", date_str):
+        elif m := _ISO_DATE_RE.match(date_str):
             year, month, day = map(int, m.groups())
             try:
                 return np.datetime64(f"{year}-{month}-{day}")
@@ -68,13 +88,13 @@ def get_date_hint(attrs: dict, filename: str) -> Optional[np.datetime64]:
         # May be other common formats we need to support
 
     # Fallback: extract YYYYMMDD from filename
-    if m := re.search(r"((?:20|19)\d{6})", filename):
+    if m := _YYYYMMDD_FILENAME_RE.search(filename):
         date_str = m.group(1)
         try:
             return np.datetime64(f"{date_str[:4]}-{date_str[4:6]}-{date_str[6:]}")
         except ValueError:
             pass
-    elif m := re.search(r"^((?:20|19)\d{2}-\d{2}-\d{2})$", filename):
+    elif m := _ISO_FILENAME_RE.search(filename):
         date_str = m.group(1)
         try:
             return np.datetime64(f"{date_str[:4]}-{date_str[4:6]}-{date_str[6:]}")
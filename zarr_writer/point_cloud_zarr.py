@@ -25,22 +25,36 @@ class PointCloudToZarrConverter(ZarrConversionStrategy):
         )
         z_ref.attrs["_ARRAY_DIMENSIONS"] = ["point"]
 
-        # Populate arrays
-        z_location[:] = np.stack([cloud.lon.values, cloud.lat.values, cloud.alt.values], axis=-1)
+        # Populate arrays. Location is written one chunk at a time so the
+        # interleaved (n, 3) temporary never exceeds a single chunk, instead of
+        # materializing a full N x 3 stack before the first byte hits the store.
+        lon = cloud.lon.values
+        lat = cloud.lat.values
+        alt = cloud.alt.values
+        for start in range(0, n_points, chunk):
+            stop = min(start + chunk, n_points)
+            z_location[start:stop] = np.stack(
+                [lon[start:stop], lat[start:stop], alt[start:stop]], axis=-1
+            )
 
         base_time = np.nanmin(cloud.time.values).astype('datetime64[s]')
         delta_time = (cloud.time.values.astype('datetime64[s]') - base_time).astype('timedelta64[s]')
-        z_time[:] = delta_time.astype(np.int32)
+        delta_seconds = delta_time.astype(np.int32)
+        z_time[:] = delta_seconds
 
         z_ref[:] = cloud.ref.values.astype(np.float32)
 
-        # Optional: save chunk metadata in a non-Xarray-visible location
+        # Optional: save chunk metadata in a non-Xarray-visible location.
+        # Chunk start times come from the in-memory delta array; indexing
+        # z_time here would decompress one store chunk per entry just to read
+        # back values we already hold.
         idx = np.arange(0, n_points, chunk)
         chunk_id = np.zeros((len(idx), 2), dtype=np.int64)
         chunk_id[:, 0] = idx
-        chunk_id[:, 1] = z_time[idx]
+        chunk_id[:, 1] = delta_seconds[idx]
         internal = root.require_group("internal")
         z_chunk_id = internal.create_array('chunk_id', shape=chunk_id.shape, dtype=np.int64)
+        z_chunk_id[:] = chunk_id
         z_chunk_id.attrs["_ARRAY_DIMENSIONS"] = ["chunk", "meta"]
 
         # Root attributes
@@ -48,5 +62,5 @@ class PointCloudToZarrConverter(ZarrConversionStrategy):
             "format": "point-cloud",
             "converted_by": cloud.attrs.get("converted_by", "unknown"),
             "projection": cloud.attrs.get("projection", "unknown"),
-            "epoch": int(np.min(cloud.time.values).astype('datetime64[s]').astype(int))
+            "epoch": int(base_time.astype(int))
         })